@@ -0,0 +1,71 @@
+"""Compiled scoring kernel for large batch audits.
+
+Walks an ASCII password buffer once and returns a bitmask of the
+character-class, repetition and keyboard-sequence checks used by
+PasswordAnalyzer. Numba is optional: without it HAVE_NUMBA is False and
+password_checker keeps using its pure-Python checks, which are faster
+than this loop when it is interpreted.
+"""
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
+LOWER = 1
+UPPER = 2
+DIGIT = 4
+SPECIAL = 8
+REPEAT = 16
+SEQUENCE = 32
+
+
+@njit(cache=True)
+def _is_sequence(a, b, c):
+    """Match the lowered trigram against 123|abc|qwe|asd|zxc"""
+    if a == 49:     # '1'
+        return b == 50 and c == 51
+    if a == 97:     # 'a'
+        return (b == 98 and c == 99) or (b == 115 and c == 100)
+    if a == 113:    # 'q'
+        return b == 119 and c == 101
+    if a == 122:    # 'z'
+        return b == 120 and c == 99
+    return False
+
+
+@njit(cache=True)
+def score_password_bytes(buf):
+    """Return the check bitmask for an ASCII-encoded password"""
+    mask = 0
+    p1 = -1
+    p2 = -1
+    l1 = -1
+    l2 = -1
+    for i in range(len(buf)):
+        c = buf[i]
+        lc = c
+        if 97 <= c <= 122:
+            mask |= LOWER
+        elif 65 <= c <= 90:
+            mask |= UPPER
+            lc = c + 32
+        elif 48 <= c <= 57:
+            mask |= DIGIT
+        else:
+            mask |= SPECIAL
+        if c == p1 and c == p2 and c != 10:  # '.' never matched '\n'
+            mask |= REPEAT
+        if _is_sequence(l2, l1, lc):
+            mask |= SEQUENCE
+        p2 = p1
+        p1 = c
+        l2 = l1
+        l1 = lc
+    return mask
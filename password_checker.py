@@ -1,226 +1,367 @@
-import re
+import bisect
+from collections import OrderedDict, namedtuple
+from dataclasses import dataclass, replace
 import math
+import multiprocessing
+import string
 import getpass
+import itertools
 import sys
-from typing import Dict, List, Tuple
+from typing import Iterable, List, Optional, Tuple
 import time
 
+import _score_kernel
+
+try:
+    import marisa_trie  # optional: compact storage for large blocklists
+except ImportError:
+    marisa_trie = None
+
+_LOWER = frozenset(string.ascii_lowercase)
+_UPPER = frozenset(string.ascii_uppercase)
+_DIGITS = frozenset(string.digits)
+_ALNUM = _LOWER | _UPPER | _DIGITS
+# Keyboard sequences, matched against the lowered password
+_BAD_TRIGRAMS = frozenset({'123', 'abc', 'qwe', 'asd', 'zxc'})
+
+CriteriaFlags = namedtuple(
+    'CriteriaFlags',
+    'len8 len12 lower upper digit special not_common no_repeat no_seq'
+)
+
+# (label, description) for each CriteriaFlags field, in field order
+_CRITERIA_META = (
+    ("Minimum 8 characters", "Longer passwords are harder to crack"),
+    ("12+ characters (recommended)", "Significantly increases security"),
+    ("Lowercase letters", "Include a-z characters"),
+    ("Uppercase letters", "Include A-Z characters"),
+    ("Numbers", "Include 0-9 digits"),
+    ("Special characters", "Include symbols like !@#$%"),
+    ("Not a common password", "Avoid easily guessable passwords"),
+    ("No repeated characters", "Avoid patterns like 'aaa' or '111'"),
+    ("No sequential patterns", "Avoid keyboard patterns"),
+)
+
+# (CriteriaFlags index, warning, suggestion) for each failed criterion, in
+# report order. len12 has no feedback of its own.
+_FEEDBACK = (
+    (0, "Password is too short", "Use at least 8 characters"),
+    (2, None, "Add lowercase letters"),
+    (3, None, "Add uppercase letters"),
+    (4, None, "Add numbers"),
+    (5, None, "Add special characters"),
+    (6, "This is a commonly used password", "Choose a unique password"),
+    (7, "Contains repeated characters", "Avoid character repetition"),
+    (8, "Contains keyboard patterns", "Avoid sequential patterns"),
+)
+
+# (minimum score, level, color emoji), strongest first
+_STRENGTH_LEVELS = (
+    (80, "Very Strong", "🟢"),
+    (60, "Strong", "🔵"),
+    (40, "Moderate", "🟡"),
+    (20, "Weak", "🟠"),
+)
+
+_SECURITY_TIPS: Tuple[str, ...] = (
+    "Use a unique password for each account",
+    "Consider using a password manager",
+    "Enable two-factor authentication when available",
+    "Use passphrases with random words",
+    "Avoid personal information in passwords",
+    "Update passwords regularly for sensitive accounts",
+)
+
+@dataclass
+class AnalysisResult:
+    """Result of PasswordAnalyzer.analyze_password"""
+    # Explicit __slots__ rather than dataclass(slots=True) to stay 3.7-compatible
+    __slots__ = ('password', 'score', 'strength', 'color_emoji', 'crack_time',
+                 'criteria', 'warnings', 'suggestions')
+    password: str
+    score: int
+    strength: str
+    color_emoji: str
+    crack_time: str
+    criteria: CriteriaFlags
+    warnings: List[str]
+    suggestions: List[str]
+
+# Crack-time buckets: seconds below _CRACK_THRESHOLDS[i] use _CRACK_FORMATS[i],
+# with the count expressed in units of the given divisor.
+_CRACK_THRESHOLDS = (1, 60, 3600, 86400, 31536000, 31536000000)
+_CRACK_FORMATS = (
+    ("Instantly", None),
+    ("{} seconds", 1),
+    ("{} minutes", 60),
+    ("{} hours", 3600),
+    ("{} days", 86400),
+    ("{} years", 31536000),
+    ("Centuries", None),
+)
+
+_GUESSES_PER_SECOND = 1_000_000_000  # 1 billion guesses per second
+# On average half the keyspace is searched before a hit
+_LOG_AVG_GUESSES = math.log(2 * _GUESSES_PER_SECOND)
+
+# Charset size (and its log) for every combination of character classes,
+# indexed by the mask lower<<3 | upper<<2 | digit<<1 | special
+_CHARSET_SIZE = tuple(
+    26 * (m >> 3 & 1) + 26 * (m >> 2 & 1) + 10 * (m >> 1 & 1) + 32 * (m & 1)
+    for m in range(16)
+)
+_CHARSET_LOG = tuple(math.log(n) if n else 0.0 for n in _CHARSET_SIZE)
+
+# Anything above 1000 years is reported as "Centuries". The small slack keeps
+# float rounding on the boundary from skipping the exact comparison below.
+_LOG_CENTURIES = math.log(31536000000) + 1e-9
+
+def _classify(password: str) -> Tuple[bool, bool, bool, bool]:
+    """Return (has_lower, has_upper, has_digit, has_special) in a single pass"""
+    chars = set(password)
+    return (
+        not chars.isdisjoint(_LOWER),
+        not chars.isdisjoint(_UPPER),
+        not chars.isdisjoint(_DIGITS),
+        not chars <= _ALNUM,
+    )
+
+def _iter_blocklist_words(f) -> Iterable[str]:
+    """Yield lowered, non-empty words from a binary file object"""
+    for raw in f:
+        try:
+            word = raw.decode("utf-8").strip().lower()
+        except UnicodeDecodeError:
+            continue  # skip rather than store a mangled entry
+        if word:
+            yield word
+
+def _load_blocklist(path: str, base: Iterable[str]):
+    """Load a newline-separated blocklist, merged with the built-in words.
+
+    Large lists (e.g. RockYou or HIBP dumps) are stored in a marisa-trie when
+    the package is installed, which is roughly 10x smaller than a set of str
+    and still answers lookups in O(len(password)). Otherwise a frozenset is used.
+    """
+    with open(path, "rb") as f:
+        words = itertools.chain(base, _iter_blocklist_words(f))
+        if marisa_trie is not None:
+            return marisa_trie.Trie(words)
+        return frozenset(words)
+
+def _has_bad_seq(pw_lower: str) -> bool:
+    """True if any 3-character window of the lowered password is a keyboard sequence"""
+    return any(pw_lower[i:i + 3] in _BAD_TRIGRAMS for i in range(len(pw_lower) - 2))
+
+def _has_triple_repeat(s: str) -> bool:
+    """True if the same character appears three times in a row
+
+    Newlines are ignored, matching the original (.)\\1{2,} pattern.
+    """
+    return any(a == b == c != "\n" for a, b, c in zip(s, s[1:], s[2:]))
+
+def _scan(password: str, pw_lower: str) -> Tuple[bool, bool, bool, bool, bool, bool]:
+    """Return (has_lower, has_upper, has_digit, has_special, has_repeat, has_seq)
+
+    ASCII passwords go through the single-pass compiled kernel when Numba is
+    installed; everything else uses the pure-Python checks.
+    """
+    if _score_kernel.HAVE_NUMBA:
+        buf = password.encode("utf-8")
+        if len(buf) == len(password):
+            m = _score_kernel.score_password_bytes(buf)
+            return (
+                bool(m & _score_kernel.LOWER),
+                bool(m & _score_kernel.UPPER),
+                bool(m & _score_kernel.DIGIT),
+                bool(m & _score_kernel.SPECIAL),
+                bool(m & _score_kernel.REPEAT),
+                bool(m & _score_kernel.SEQUENCE),
+            )
+    has_lower, has_upper, has_digit, has_special = _classify(password)
+    return (
+        has_lower, has_upper, has_digit, has_special,
+        _has_triple_repeat(password),
+        _has_bad_seq(pw_lower),
+    )
+
 class PasswordAnalyzer:
-    def __init__(self):
-        self.common_passwords = [
-            "password", "123456", "password123", "admin", "qwerty", 
-            "letmein", "welcome", "monkey", "1234567890", "abc123",
-            "password1", "123456789", "welcome123", "admin123", "root",
-            "toor", "pass", "test", "guest", "login", "master", "hello",
-            "sunshine", "princess", "football", "charlie", "aa123456"
-        ]
+    COMMON_PASSWORDS = frozenset({
+        "password", "123456", "password123", "admin", "qwerty",
+        "letmein", "welcome", "monkey", "1234567890", "abc123",
+        "password1", "123456789", "welcome123", "admin123", "root",
+        "toor", "pass", "test", "guest", "login", "master", "hello",
+        "sunshine", "princess", "football", "charlie", "aa123456"
+    })
+
+    def __init__(self, blocklist_path: Optional[str] = None, cache_size: int = 0):
+        if blocklist_path:
+            self.common_passwords = _load_blocklist(blocklist_path, self.COMMON_PASSWORDS)
+        else:
+            self.common_passwords = self.COMMON_PASSWORDS
+        # Results cache for repeated inputs (e.g. credential dumps). Off by
+        # default so interactive use never keeps plaintext passwords around.
+        self.cache_size = cache_size
+        self._cache = OrderedDict() if cache_size > 0 else None
     
-    def check_criteria(self, password: str) -> Dict[str, Dict[str, any]]:
+    def check_criteria(self, password: str, pw_lower: Optional[str] = None) -> CriteriaFlags:
         """Check various password security criteria"""
-        criteria = {
-            "length_8": {
-                "met": len(password) >= 8,
-                "label": "Minimum 8 characters",
-                "description": "Longer passwords are harder to crack"
-            },
-            "length_12": {
-                "met": len(password) >= 12,
-                "label": "12+ characters (recommended)",
-                "description": "Significantly increases security"
-            },
-            "lowercase": {
-                "met": bool(re.search(r'[a-z]', password)),
-                "label": "Lowercase letters",
-                "description": "Include a-z characters"
-            },
-            "uppercase": {
-                "met": bool(re.search(r'[A-Z]', password)),
-                "label": "Uppercase letters", 
-                "description": "Include A-Z characters"
-            },
-            "numbers": {
-                "met": bool(re.search(r'[0-9]', password)),
-                "label": "Numbers",
-                "description": "Include 0-9 digits"
-            },
-            "special_chars": {
-                "met": bool(re.search(r'[^a-zA-Z0-9]', password)),
-                "label": "Special characters",
-                "description": "Include symbols like !@#$%"
-            },
-            "not_common": {
-                "met": password.lower() not in self.common_passwords,
-                "label": "Not a common password",
-                "description": "Avoid easily guessable passwords"
-            },
-            "no_repeats": {
-                "met": not bool(re.search(r'(.)\1{2,}', password)),
-                "label": "No repeated characters",
-                "description": "Avoid patterns like 'aaa' or '111'"
-            },
-            "no_sequences": {
-                "met": not bool(re.search(r'123|abc|qwe|asd|zxc', password, re.IGNORECASE)),
-                "label": "No sequential patterns",
-                "description": "Avoid keyboard patterns"
-            }
-        }
-        return criteria
+        if pw_lower is None:
+            pw_lower = password.lower()
+        has_lower, has_upper, has_digit, has_special, has_repeat, has_seq = _scan(password, pw_lower)
+        plen = len(password)
+        return CriteriaFlags(
+            len8=plen >= 8,
+            len12=plen >= 12,
+            lower=has_lower,
+            upper=has_upper,
+            digit=has_digit,
+            special=has_special,
+            not_common=pw_lower not in self.common_passwords,
+            no_repeat=not has_repeat,
+            no_seq=not has_seq,
+        )
     
-    def calculate_score(self, criteria: Dict) -> int:
+    def calculate_score(self, criteria: CriteriaFlags) -> int:
         """Calculate password strength score (0-100)"""
-        met_criteria = sum(1 for c in criteria.values() if c["met"])
-        return min(100, int((met_criteria / len(criteria)) * 100))
+        return sum(criteria) * 100 // len(criteria)
     
     def get_strength_level(self, score: int) -> Tuple[str, str]:
         """Get strength level and color based on score"""
-        if score >= 80:
-            return "Very Strong", "🟢"
-        elif score >= 60:
-            return "Strong", "🔵"
-        elif score >= 40:
-            return "Moderate", "🟡"
-        elif score >= 20:
-            return "Weak", "🟠"
-        else:
-            return "Very Weak", "🔴"
+        for threshold, level, emoji in _STRENGTH_LEVELS:
+            if score >= threshold:
+                return level, emoji
+        return "Very Weak", "🔴"
     
-    def estimate_crack_time(self, password: str) -> str:
-        """Estimate time to crack password using brute force"""
+    def estimate_crack_time(self, password: str, criteria: Optional[CriteriaFlags] = None) -> str:
+        """Estimate time to crack password using brute force
+
+        Pass the password's criteria to reuse their character-class flags
+        instead of scanning the password again.
+        """
         if not password:
             return "N/A"
         
-        charset_size = 0
-        if re.search(r'[a-z]', password):
-            charset_size += 26
-        if re.search(r'[A-Z]', password):
-            charset_size += 26
-        if re.search(r'[0-9]', password):
-            charset_size += 10
-        if re.search(r'[^a-zA-Z0-9]', password):
-            charset_size += 32
+        if criteria is None:
+            has_lower, has_upper, has_digit, has_special = _classify(password)
+        else:
+            has_lower, has_upper = criteria.lower, criteria.upper
+            has_digit, has_special = criteria.digit, criteria.special
+        mask = has_lower << 3 | has_upper << 2 | has_digit << 1 | has_special
+        charset_size = _CHARSET_SIZE[mask]
         
         if charset_size == 0:
             return "Instantly"
         
-        combinations = charset_size ** len(password)
-        guesses_per_second = 1_000_000_000  # 1 billion guesses per second
-        seconds_to_crack = combinations / (2 * guesses_per_second)
-        
-        if seconds_to_crack < 1:
-            return "Instantly"
-        elif seconds_to_crack < 60:
-            return f"{int(seconds_to_crack)} seconds"
-        elif seconds_to_crack < 3600:
-            return f"{int(seconds_to_crack / 60)} minutes"
-        elif seconds_to_crack < 86400:
-            return f"{int(seconds_to_crack / 3600)} hours"
-        elif seconds_to_crack < 31536000:
-            return f"{int(seconds_to_crack / 86400)} days"
-        elif seconds_to_crack < 31536000000:
-            return f"{int(seconds_to_crack / 31536000)} years"
-        else:
+        plen = len(password)
+        # Bucket in log space first so long passwords never build a huge int
+        log_seconds = plen * _CHARSET_LOG[mask] - _LOG_AVG_GUESSES
+        if log_seconds > _LOG_CENTURIES:
             return "Centuries"
+        
+        combinations = charset_size ** plen
+        seconds_to_crack = combinations / (2 * _GUESSES_PER_SECOND)
+        
+        template, unit = _CRACK_FORMATS[bisect.bisect_right(_CRACK_THRESHOLDS, seconds_to_crack)]
+        if unit is None:
+            return template
+        return template.format(int(seconds_to_crack / unit))
     
-    def get_warnings_and_suggestions(self, password: str, criteria: Dict) -> Tuple[List[str], List[str]]:
+    def get_warnings_and_suggestions(self, password: str,
+                                     criteria: CriteriaFlags) -> Tuple[List[str], List[str]]:
         """Generate warnings and suggestions based on analysis"""
         warnings = []
         suggestions = []
-        
-        if len(password) < 8:
-            warnings.append("Password is too short")
-            suggestions.append("Use at least 8 characters")
-        
-        if not criteria["lowercase"]["met"]:
-            suggestions.append("Add lowercase letters")
-        if not criteria["uppercase"]["met"]:
-            suggestions.append("Add uppercase letters")
-        if not criteria["numbers"]["met"]:
-            suggestions.append("Add numbers")
-        if not criteria["special_chars"]["met"]:
-            suggestions.append("Add special characters")
-        
-        if password.lower() in self.common_passwords:
-            warnings.append("This is a commonly used password")
-            suggestions.append("Choose a unique password")
-        
-        if re.search(r'(.)\1{2,}', password):
-            warnings.append("Contains repeated characters")
-            suggestions.append("Avoid character repetition")
-        
-        if re.search(r'123|abc|qwe|asd|zxc', password, re.IGNORECASE):
-            warnings.append("Contains keyboard patterns")
-            suggestions.append("Avoid sequential patterns")
+        for index, warning, suggestion in _FEEDBACK:
+            if not criteria[index]:
+                if warning is not None:
+                    warnings.append(warning)
+                suggestions.append(suggestion)
         
         return warnings, suggestions
     
-    def analyze_password(self, password: str) -> Dict:
+    def analyze_password(self, password: str) -> AnalysisResult:
         """Complete password analysis"""
-        criteria = self.check_criteria(password)
+        if self._cache is None:
+            return self._analyze(password)
+        analysis = self._cache.get(password)
+        if analysis is None:
+            analysis = self._analyze(password)
+            if len(self._cache) >= self.cache_size:
+                self._cache.popitem(last=False)  # evict least recently used
+            self._cache[password] = analysis
+        else:
+            self._cache.move_to_end(password)
+        # Copy the mutable lists so callers can't alter the cached entry
+        return replace(analysis, warnings=list(analysis.warnings),
+                       suggestions=list(analysis.suggestions))
+    
+    def _analyze(self, password: str) -> AnalysisResult:
+        pw_lower = password.lower()
+        criteria = self.check_criteria(password, pw_lower)
         score = self.calculate_score(criteria)
         strength, color_emoji = self.get_strength_level(score)
-        crack_time = self.estimate_crack_time(password)
+        crack_time = self.estimate_crack_time(password, criteria)
         warnings, suggestions = self.get_warnings_and_suggestions(password, criteria)
         
-        return {
-            "password": password,
-            "score": score,
-            "strength": strength,
-            "color_emoji": color_emoji,
-            "crack_time": crack_time,
-            "criteria": criteria,
-            "warnings": warnings,
-            "suggestions": suggestions
-        }
-
-def print_analysis_report(analysis: Dict):
-    """Print formatted analysis report"""
-    print("\n" + "="*60)
-    print("🔐 PASSWORD SECURITY ANALYSIS REPORT")
-    print("="*60)
+        return AnalysisResult(
+            password=password,
+            score=score,
+            strength=strength,
+            color_emoji=color_emoji,
+            crack_time=crack_time,
+            criteria=criteria,
+            warnings=warnings,
+            suggestions=suggestions,
+        )
+
+def format_analysis_report(analysis: AnalysisResult) -> str:
+    """Build the formatted analysis report as a single string"""
+    out: List[str] = []
+    out.append("\n" + "="*60)
+    out.append("🔐 PASSWORD SECURITY ANALYSIS REPORT")
+    out.append("="*60)
     
     # Overall strength
-    print(f"\n📊 OVERALL STRENGTH")
-    print(f"   Score: {analysis['score']}/100")
-    print(f"   Level: {analysis['color_emoji']} {analysis['strength']}")
-    print(f"   Estimated crack time: {analysis['crack_time']}")
+    out.append("\n📊 OVERALL STRENGTH")
+    out.append(f"   Score: {analysis.score}/100")
+    out.append(f"   Level: {analysis.color_emoji} {analysis.strength}")
+    out.append(f"   Estimated crack time: {analysis.crack_time}")
     
     # Security criteria
-    print(f"\n✅ SECURITY CRITERIA")
-    for key, criterion in analysis['criteria'].items():
-        status = "✅" if criterion['met'] else "❌"
-        print(f"   {status} {criterion['label']}")
-        print(f"      {criterion['description']}")
+    out.append("\n✅ SECURITY CRITERIA")
+    for met, (label, description) in zip(analysis.criteria, _CRITERIA_META):
+        status = "✅" if met else "❌"
+        out.append(f"   {status} {label}")
+        out.append(f"      {description}")
     
     # Warnings
-    if analysis['warnings']:
-        print(f"\n⚠️  SECURITY WARNINGS")
-        for warning in analysis['warnings']:
-            print(f"   • {warning}")
+    if analysis.warnings:
+        out.append("\n⚠️  SECURITY WARNINGS")
+        for warning in analysis.warnings:
+            out.append(f"   • {warning}")
     
     # Suggestions
-    if analysis['suggestions']:
-        print(f"\n💡 IMPROVEMENT SUGGESTIONS")
-        for suggestion in analysis['suggestions']:
-            print(f"   • {suggestion}")
+    if analysis.suggestions:
+        out.append("\n💡 IMPROVEMENT SUGGESTIONS")
+        for suggestion in analysis.suggestions:
+            out.append(f"   • {suggestion}")
     
     # Security tips
-    print(f"\n🛡️  SECURITY BEST PRACTICES")
-    tips = [
-        "Use a unique password for each account",
-        "Consider using a password manager",
-        "Enable two-factor authentication when available",
-        "Use passphrases with random words",
-        "Avoid personal information in passwords",
-        "Update passwords regularly for sensitive accounts"
-    ]
-    for tip in tips:
-        print(f"   • {tip}")
+    out.append("\n🛡️  SECURITY BEST PRACTICES")
+    for tip in _SECURITY_TIPS:
+        out.append(f"   • {tip}")
     
-    print("\n" + "="*60)
+    out.append("\n" + "="*60)
+    return "\n".join(out) + "\n"
+
+def print_analysis_report(analysis: AnalysisResult):
+    """Print formatted analysis report"""
+    sys.stdout.write(format_analysis_report(analysis))
 
-def interactive_mode():
+def interactive_mode(blocklist_path: Optional[str] = None):
     """Interactive password checking mode"""
-    analyzer = PasswordAnalyzer()
+    analyzer = PasswordAnalyzer(blocklist_path)
     
     print("🔐 Password Security Checker")
     print("="*40)
@@ -247,22 +388,85 @@ def interactive_mode():
         except Exception as e:
             print(f"Error: {e}")
 
-def batch_mode(passwords: List[str]):
-    """Batch analysis mode for multiple passwords"""
-    analyzer = PasswordAnalyzer()
-    
+BATCH_CACHE_SIZE = 131072
+
+_worker_analyzer = None
+
+def _init_worker(blocklist_path: Optional[str]):
+    """Set up the worker's analyzer without pickling it per task
+
+    Forked workers inherit the analyzer (and its blocklist) that batch_mode
+    built in the parent. Only spawn-based platforms (Windows, macOS) have to
+    load the blocklist again in every worker.
+    """
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = PasswordAnalyzer(blocklist_path, cache_size=BATCH_CACHE_SIZE)
+
+def _report_in_worker(password: str) -> str:
+    # Format in the worker too, so only the finished report crosses the pipe
+    return format_analysis_report(_worker_analyzer.analyze_password(password))
+
+def batch_mode(passwords: List[str], jobs: Optional[int] = 1,
+               blocklist_path: Optional[str] = None):
+    """Batch analysis mode for multiple passwords
+
+    With jobs != 1 the analyses run in a process pool (None = one worker per
+    CPU); reports are still printed in input order.
+    """
     print("🔐 Batch Password Analysis")
     print("="*50)
     
-    for i, password in enumerate(passwords, 1):
-        print(f"\n📋 Analysis {i}/{len(passwords)}")
-        analysis = analyzer.analyze_password(password)
-        print_analysis_report(analysis)
-        
-        if i < len(passwords):
-            print("\n" + "="*60)
+    analyzer = PasswordAnalyzer(blocklist_path, cache_size=BATCH_CACHE_SIZE)
+    if jobs == 1:
+        reports = (format_analysis_report(analyzer.analyze_password(p)) for p in passwords)
+        _write_batch_reports(reports, len(passwords))
+        return
+    
+    # Load the blocklist once here; forked workers share it instead of
+    # each building their own copy.
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+    try:
+        # Leaving the with-block early (broken pipe, Ctrl-C) terminates the
+        # workers instead of waiting for the remaining queue to be analyzed.
+        with multiprocessing.Pool(jobs, initializer=_init_worker,
+                                  initargs=(blocklist_path,)) as pool:
+            reports = pool.imap(_report_in_worker, passwords, chunksize=64)
+            _write_batch_reports(reports, len(passwords))
+            pool.close()
+            pool.join()
+    finally:
+        _worker_analyzer = None
+
+def _write_batch_reports(reports: Iterable[str], total: int):
+    for i, report in enumerate(reports, 1):
+        # One write per password instead of one print per report line
+        out = f"\n📋 Analysis {i}/{total}\n" + report
+        if i < total:
+            out += "\n" + "="*60 + "\n"
+        sys.stdout.write(out)
+
+def read_password_file(path: str) -> Tuple[List[str], int]:
+    """Read one password per line, skipping blank lines
 
-def demo_mode():
+    Lines that are not valid UTF-8 are skipped rather than analyzed with
+    bytes missing; returns (passwords, number of skipped lines).
+    """
+    passwords = []
+    skipped = 0
+    with open(path, "rb") as f:
+        for raw in f:
+            raw = raw.rstrip(b"\r\n")
+            if not raw:
+                continue
+            try:
+                passwords.append(raw.decode("utf-8"))
+            except UnicodeDecodeError:
+                skipped += 1
+    return passwords, skipped
+
+def demo_mode(blocklist_path: Optional[str] = None):
     """Demonstration with sample passwords"""
     sample_passwords = [
         "123456",           # Very weak
@@ -277,23 +481,60 @@ def demo_mode():
     print("="*50)
     print("Analyzing sample passwords to demonstrate the tool...\n")
     
-    batch_mode(sample_passwords)
+    batch_mode(sample_passwords, blocklist_path=blocklist_path)
 
 def main():
     """Main function with command line interface"""
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "--demo":
-            demo_mode()
-        elif sys.argv[1] == "--help":
+    args = sys.argv[1:]
+    blocklist_path = None
+    if "--blocklist" in args:
+        i = args.index("--blocklist")
+        if i + 1 >= len(args):
+            print("Missing file. Usage: python password_checker.py --blocklist FILE [...]")
+            return
+        blocklist_path = args[i + 1]
+        del args[i:i + 2]
+        try:
+            open(blocklist_path, "rb").close()
+        except OSError as e:
+            print(f"Cannot read blocklist: {e}")
+            return
+    
+    if args:
+        if args[0] == "--demo":
+            demo_mode(blocklist_path)
+        elif args[0] == "--batch":
+            if len(args) < 2:
+                print("Missing file. Usage: python password_checker.py --batch FILE [--jobs N]")
+                return
+            jobs = None
+            if len(args) > 2:
+                if args[2] != "--jobs" or len(args) < 4 or not args[3].isdigit():
+                    print("Unknown option. Use --help for usage information.")
+                    return
+                jobs = int(args[3]) or None
+            try:
+                passwords, skipped = read_password_file(args[1])
+            except OSError as e:
+                print(f"Cannot read password file: {e}")
+                return
+            if skipped:
+                print(f"Skipped {skipped} line(s) that are not valid UTF-8", file=sys.stderr)
+            batch_mode(passwords, jobs, blocklist_path)
+        elif args[0] == "--help":
             print("🔐 Password Security Checker")
             print("Usage:")
-            print("  python password_checker.py           # Interactive mode")
-            print("  python password_checker.py --demo    # Demo with sample passwords")
-            print("  python password_checker.py --help    # Show this help")
+            print("  python password_checker.py                       # Interactive mode")
+            print("  python password_checker.py --demo                # Demo with sample passwords")
+            print("  python password_checker.py --batch FILE          # Analyze one password per line")
+            print("  python password_checker.py --batch FILE --jobs N # ...using N worker processes")
+            print("                                                   # (on Windows/macOS each worker loads --blocklist itself)")
+            print("  python password_checker.py --help                # Show this help")
+            print("Add --blocklist FILE to any mode to check against a custom common-password list.")
         else:
             print("Unknown option. Use --help for usage information.")
     else:
-        interactive_mode()
+        interactive_mode(blocklist_path)
 
 if __name__ == "__main__":
     main()
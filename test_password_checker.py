@@ -0,0 +1,56 @@
+import random
+import unittest
+from unittest import mock
+
+import _score_kernel
+import password_checker
+
+
+def _scan_with(password: str, use_kernel: bool):
+    with mock.patch.object(_score_kernel, "HAVE_NUMBA", use_kernel):
+        return password_checker._scan(password, password.lower())
+
+
+class ScanParityTest(unittest.TestCase):
+    """The compiled kernel and the pure-Python checks must agree.
+
+    With HAVE_NUMBA forced on, _scan goes through score_password_bytes
+    (JIT-compiled if Numba is installed, interpreted otherwise).
+    """
+
+    EDGE_CASES = [
+        "", "a", "aa", "aaa", "AAA", "aAa", "111", "!!!", "\n\n\n", "a\n\n\na",
+        "123", "abc", "ABC", "aBc", "qwe", "QWE", "asd", "zxc", "ZxC",
+        "12", "ab", "1a2b3c", "cba", "321", "xzc", "abccc", "aaa123",
+        "a\nbc", "ab\nc", "1\n23", "~`|", " \t ", "\x00\x00\x00", "\x7f",
+        "Tr0ub4dor&3", "correct-horse-battery-staple-2024!",
+    ]
+
+    def assertParity(self, password: str):
+        self.assertEqual(
+            _scan_with(password, True), _scan_with(password, False), repr(password)
+        )
+
+    def test_edge_cases(self):
+        for password in self.EDGE_CASES:
+            self.assertParity(password)
+
+    def test_random_ascii(self):
+        rng = random.Random(1234)
+        alphabet = "aAbBcC123qQwWeEsSdDzZxX!~ \n\t" + "".join(map(chr, range(128)))
+        for _ in range(20000):
+            password = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+            self.assertParity(password)
+
+    def test_every_trigram_from_python_rule_is_detected(self):
+        for trigram in password_checker._BAD_TRIGRAMS:
+            for variant in (trigram, trigram.upper(), "x" + trigram.title() + "y"):
+                self.assertTrue(_scan_with(variant, True)[5], variant)
+
+    def test_non_ascii_falls_back_to_python(self):
+        for password in ("ééé", "Ab1é", "ſ\nſ\nſ"):
+            self.assertParity(password)
+
+
+if __name__ == "__main__":
+    unittest.main()